@@ -2,11 +2,23 @@
 MIDI encoding base class and methods
 """
 from abc import ABC, abstractmethod
+from functools import wraps
 import math
 from pathlib import Path
 import json
 from copy import deepcopy
-from typing import List, Tuple, Dict, Union, Callable, Iterable, Optional, Any, Sequence
+from typing import (
+    List,
+    Tuple,
+    Dict,
+    Union,
+    Callable,
+    Iterable,
+    Optional,
+    Any,
+    Sequence,
+    Sized,
+)
 
 import numpy as np
 from tqdm import tqdm
@@ -112,12 +124,15 @@ def convert_sequence_to_tokseq(
 def _in_as_seq(complete: bool = True, decode_bpe: bool = True):
     r"""Decorator creating if necessary and completing a :class:`miditok.TokSequence` object before that the function
     is called. This decorator is made to be used by the :py:meth:`miditok.MIDITokenizer.tokens_to_midi` method.
+    The undecorated method remains accessible through the ``__wrapped__`` attribute of the decorated one, to be
+    called directly with a :class:`miditok.TokSequence` already in the expected state.
 
     :param complete: will complete the sequence, i.e. complete its ``ids`` , ``tokens`` and ``events`` .
     :param decode_bpe: will decode BPE, if applicable. This step is performed before completing the sequence.
     """
 
     def decorator(function: Callable = None):
+        @wraps(function)
         def wrapper(*args, **kwargs):
             tokenizer = args[0]
             seq = args[1]
@@ -147,6 +162,7 @@ def _in_as_seq(complete: bool = True, decode_bpe: bool = True):
 def _out_as_complete_seq(function: Callable):
     r"""Decorator completing an output :class:`miditok.TokSequence` object."""
 
+    @wraps(function)
     def wrapper(*args, **kwargs):
         self = args[0]
         res = function(*args, **kwargs)
@@ -222,6 +238,7 @@ class MIDITokenizer(ABC):
             if 0 in beat_range:
                 self._first_beat_res = res
                 break
+        self._max_beat_res = max(self.config.beat_res.values())
 
         # Tempos
         self.tempos = np.zeros(1)
@@ -374,7 +391,7 @@ class MIDITokenizer(ABC):
         :param notes: notes to quantize.
         :param time_division: MIDI time division / resolution, in ticks/beat (of the MIDI being parsed).
         """
-        ticks_per_sample = int(time_division / max(self.config.beat_res.values()))
+        ticks_per_sample = int(time_division / self._max_beat_res)
         i = 0
         pitches = range(*self.config.pitch_range)
         while i < len(notes):
@@ -417,7 +434,7 @@ class MIDITokenizer(ABC):
         :param tempos: tempo changes to quantize.
         :param time_division: MIDI time division / resolution, in ticks/beat (of the MIDI being parsed).
         """
-        ticks_per_sample = int(time_division / max(self.config.beat_res.values()))
+        ticks_per_sample = int(time_division / self._max_beat_res)
         prev_tempo = -1
         i = 0
         while i < len(tempos):
@@ -691,7 +708,7 @@ class MIDITokenizer(ABC):
 
         # Write MIDI file
         if output_path:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             midi.dump(output_path)
         return midi
 
@@ -1137,8 +1154,12 @@ class MIDITokenizer(ABC):
             show_progress=True,
             **kwargs,
         )
+        # The training (pairs counting and merges) is performed by 🤗tokenizers in Rust,
+        # and already parallelized over the available CPUs
         self._bpe_model.train_from_iterator(
-            iterator, length=sum(1 for _ in iterator), trainer=trainer
+            iterator,
+            length=len(iterator) if isinstance(iterator, Sized) else None,
+            trainer=trainer,
         )
 
         # Update other vocabs accordingly
@@ -1323,7 +1344,7 @@ class MIDITokenizer(ABC):
                 continue
 
             # Checks the time division is valid
-            if midi.ticks_per_beat < max(self.config.beat_res.values()) * 4:
+            if midi.ticks_per_beat < self._max_beat_res * 4:
                 continue
             # Passing the MIDI to validation tests if given
             if validation_fn is not None:
@@ -1456,14 +1477,17 @@ class MIDITokenizer(ABC):
         if "ids_bpe_encoded" not in kwargs and ids_bpe_encoded is not None:
             kwargs["ids_bpe_encoded"] = ids_bpe_encoded
 
+        # Serialized at once with json.dumps, which unlike json.dump (writing the file
+        # chunk by chunk) uses the C encoder
         with open(path, "w") as outfile:
-            json.dump(
-                {
-                    "ids": ids,
-                    "programs": programs if programs is not None else [],
-                    **kwargs,
-                },
-                outfile,
+            outfile.write(
+                json.dumps(
+                    {
+                        "ids": ids,
+                        "programs": programs if programs is not None else [],
+                        **kwargs,
+                    }
+                )
             )
 
     @staticmethod
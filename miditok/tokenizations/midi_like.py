@@ -195,7 +195,7 @@ class MIDILike(MIDITokenizer):
                                 note off event. Leave None to discard Note On with no Note Off event.
         :return: the miditoolkit instrument object and tempo changes
         """
-        ticks_per_sample = time_division // max(self.config.beat_res.values())
+        ticks_per_sample = time_division // self._max_beat_res
         events = (
             tokens.events
             if tokens.events is not None
@@ -375,9 +375,9 @@ class MIDILike(MIDITokenizer):
 
         err = 0
         current_pitches = []
-        max_duration = self.durations[-1][0] * max(self.config.beat_res.values())
+        max_duration = self.durations[-1][0] * self._max_beat_res
         max_duration += self.durations[-1][1] * (
-            max(self.config.beat_res.values()) // self.durations[-1][2]
+            self._max_beat_res // self.durations[-1][2]
         )
 
         events = (
@@ -404,7 +404,7 @@ class MIDILike(MIDITokenizer):
                             break  # all good
                         elif events[j].type == "TimeShift":
                             offset_sample += self._token_duration_to_ticks(
-                                events[j].value, max(self.config.beat_res.values())
+                                events[j].value, self._max_beat_res
                             )
 
                         if (
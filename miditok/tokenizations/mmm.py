@@ -267,10 +267,10 @@ class MMM(MIDITokenizer):
         tokens = cast(TokSequence, tokens)
         midi = MidiFile(ticks_per_beat=time_division)
         assert (
-            time_division % max(self.config.beat_res.values()) == 0
-        ), f"Invalid time division, please give one divisible by {max(self.config.beat_res.values())}"
+            time_division % self._max_beat_res == 0
+        ), f"Invalid time division, please give one divisible by {self._max_beat_res}"
         tokens = cast(List[str], tokens.tokens)  # for reducing type errors
-        ticks_per_sample = time_division // max(self.config.beat_res.values())
+        ticks_per_sample = time_division // self._max_beat_res
 
         # RESULTS
         instruments: List[Instrument] = []
@@ -370,7 +370,7 @@ class MMM(MIDITokenizer):
         )
         # Write MIDI file
         if output_path:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             midi.dump(output_path)
         return midi
 
@@ -118,7 +118,7 @@ class MuMIDI(MIDITokenizer):
             key=lambda x: (x[0].time, x[0].desc)
         )  # Sort by time then track
 
-        ticks_per_sample = midi.ticks_per_beat / max(self.config.beat_res.values())
+        ticks_per_sample = midi.ticks_per_beat / self._max_beat_res
         ticks_per_bar = midi.ticks_per_beat * 4
         tokens = []
 
@@ -295,8 +295,8 @@ class MuMIDI(MIDITokenizer):
         :return: the midi object (miditoolkit.MidiFile)
         """
         assert (
-            time_division % max(self.config.beat_res.values()) == 0
-        ), f"Invalid time division, please give one divisible by {max(self.config.beat_res.values())}"
+            time_division % self._max_beat_res == 0
+        ), f"Invalid time division, please give one divisible by {self._max_beat_res}"
         midi = MidiFile(ticks_per_beat=time_division)
 
         # Tempos
@@ -306,7 +306,7 @@ class MuMIDI(MIDITokenizer):
             first_tempo = TEMPO
         midi.tempo_changes.append(TempoChange(first_tempo, 0))
 
-        ticks_per_sample = time_division // max(self.config.beat_res.values())
+        ticks_per_sample = time_division // self._max_beat_res
         tracks = {}
         current_tick = 0
         current_bar = -1
@@ -362,7 +362,7 @@ class MuMIDI(MIDITokenizer):
 
         # Write MIDI file
         if output_path:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             midi.dump(output_path)
         return midi
 
@@ -410,7 +410,7 @@ class MuMIDI(MIDITokenizer):
             for i in range(*self.config.additional_params["drum_pitch_range"])
         ]
         vocab[0] += ["Bar_None"]  # new bar token
-        nb_positions = max(self.config.beat_res.values()) * 4  # 4/* time signature
+        nb_positions = self._max_beat_res * 4  # 4/* time signature
         vocab[0] += [f"Position_{i}" for i in range(nb_positions)]
         vocab[0] += [f"Program_{program}" for program in self.config.programs]
 
@@ -120,7 +120,7 @@ class Octuple(MIDITokenizer):
         # Make sure the notes are sorted first by their onset (start) times, second by pitch
         # notes.sort(key=lambda x: (x.start, x.pitch))  # done in midi_to_tokens
         time_division = self._current_midi_metadata["time_division"]
-        ticks_per_sample = time_division / max(self.config.beat_res.values())
+        ticks_per_sample = time_division / self._max_beat_res
         dur_bins = self._durations_ticks[time_division]
 
         tokens = []
@@ -251,10 +251,10 @@ class Octuple(MIDITokenizer):
         :return: the midi object (miditoolkit.MidiFile)
         """
         assert (
-            time_division % max(self.config.beat_res.values()) == 0
-        ), f"Invalid time division, please give one divisible by {max(self.config.beat_res.values())}"
+            time_division % self._max_beat_res == 0
+        ), f"Invalid time division, please give one divisible by {self._max_beat_res}"
         midi = MidiFile(ticks_per_beat=time_division)
-        ticks_per_sample = time_division // max(self.config.beat_res.values())
+        ticks_per_sample = time_division // self._max_beat_res
         tokens = tokens.tokens
 
         tempo_changes = [TempoChange(TEMPO, 0)]
@@ -353,7 +353,7 @@ class Octuple(MIDITokenizer):
 
         # Write MIDI file
         if output_path:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             midi.dump(output_path)
         return midi
 
@@ -402,7 +402,7 @@ class Octuple(MIDITokenizer):
         vocab[3] += [f"Program_{i}" for i in self.config.programs]
 
         # POSITION
-        nb_positions = max(self.config.beat_res.values()) * 4  # 4/4 time signature
+        nb_positions = self._max_beat_res * 4  # 4/4 time signature
         vocab[4] += [f"Position_{i}" for i in range(nb_positions)]
 
         # BAR (positional encoding)
@@ -154,11 +154,11 @@ class OctupleMono(MIDITokenizer):
         :return: the miditoolkit instrument object and tempo changes
         """
         assert (
-            time_division % max(self.config.beat_res.values()) == 0
-        ), f"Invalid time division, please give one divisible by {max(self.config.beat_res.values())}"
+            time_division % self._max_beat_res == 0
+        ), f"Invalid time division, please give one divisible by {self._max_beat_res}"
         tokens = tokens.tokens
 
-        ticks_per_sample = time_division // max(self.config.beat_res.values())
+        ticks_per_sample = time_division // self._max_beat_res
         name = "Drums" if program[1] else MIDI_INSTRUMENTS[program[0]]["name"]
         instrument = Instrument(program[0], is_drum=program[1], name=name)
 
@@ -225,7 +225,7 @@ class OctupleMono(MIDITokenizer):
         ]
 
         # POSITION
-        nb_positions = max(self.config.beat_res.values()) * 4  # 4/4 time signature
+        nb_positions = self._max_beat_res * 4  # 4/4 time signature
         vocab[3] += [f"Position_{i}" for i in range(nb_positions)]
 
         # BAR
@@ -1,3 +1,4 @@
+from itertools import chain
 from math import ceil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
@@ -15,6 +16,23 @@ from ..constants import (
 from ..midi_tokenizer import MIDITokenizer, _in_as_seq, _out_as_complete_seq
 from ..utils import detect_chords
 
+# Codes of the token types, used to decode tokens from their ids
+_BAR, _POSITION, _PROGRAM, _PITCH, _VELOCITY = range(5)
+_DURATION, _TIME_SIG, _TEMPO, _REST = range(5, 9)
+_TOKEN_TYPES_CODES = {
+    "Bar": _BAR,
+    "Position": _POSITION,
+    "Program": _PROGRAM,
+    "Pitch": _PITCH,
+    "Velocity": _VELOCITY,
+    "Duration": _DURATION,
+    "TimeSig": _TIME_SIG,
+    "Tempo": _TEMPO,
+    "Rest": _REST,
+}
+# Token types whose values are decoded as integers
+_INT_VALUE_TOKEN_TYPES = ("Position", "Program", "Pitch", "Velocity", "Tempo")
+
 
 class REMIPlus(MIDITokenizer):
     r"""REMI+ is extended REMI representation (Huang and Yang) for general
@@ -34,6 +52,14 @@ class REMIPlus(MIDITokenizer):
             tokenizer learned Byte Pair Encoding. (default: None)
     """
 
+    # Base vocabularies and token types graphs already created, shared by all instances
+    # and keyed by the parameters they depend on, see _create_base_vocabulary
+    _base_vocabularies_cache: Dict[tuple, List[str]] = {}
+    _token_types_graphs_cache: Dict[tuple, Dict[str, List[str]]] = {}
+    # Order indexes of the events to sort them, by type and for Position by desc, see _order
+    _ORDER_TABLE: Dict[str, int] = {"Bar": 0, "TimeSig": 1, "Tempo": 3, "Rest": 7}
+    _POSITION_ORDER: Dict[str, int] = {"PositionTempo": 2}
+
     def __init__(
         self,
         tokenizer_config: TokenizerConfig = None,
@@ -47,6 +73,13 @@ class REMIPlus(MIDITokenizer):
             # If used, this attribute might increase over tokenizations, if the tokenizer encounter longer MIDIs
             tokenizer_config.additional_params["max_bar_embedding"] = max_bar_embedding
         super().__init__(tokenizer_config, True, params)
+        # Tables of the token ids type codes and values, see _token_ids_types_values
+        self._decoding_tables = None
+        # Values of the Bar tokens as strings, indexed by bar number and extended as
+        # longer MIDIs are tokenized, so that they are not formatted for each bar
+        self._bar_values: List[str] = []
+        # Values of the Duration tokens as strings, indexed like self.durations
+        self._durations_values = [".".join(map(str, dur)) for dur in self.durations]
 
     def _tweak_config_before_creating_voc(self):
         self.config.use_programs = True
@@ -65,32 +98,51 @@ class REMIPlus(MIDITokenizer):
         :param tracks: list of tracks (`miditoolkit.Instrument`) to convert.
         :return: sequences of Event.
         """
-        # Flatten all notes
-        notes_with_program = [
-            (note, (track.program, track.is_drum))
-            for track in tracks
-            for note in track.notes
-        ]
-        notes_with_program.sort(key=lambda n: (n[0].start, n[0].pitch))
-
-        # Make sure the notes are sorted first by their onset (start) times, second by pitch
-        # notes.sort(key=lambda x: (x.start, x.pitch))  # done in midi_to_tokens
         time_division = self._current_midi_metadata["time_division"]
-        ticks_per_sample = time_division / max(self.config.beat_res.values())
+        ticks_per_sample = time_division / self._max_beat_res
         dur_bins = self._durations_ticks[self._current_midi_metadata["time_division"]]
+
+        # Gather the attributes of the notes of all tracks as arrays, so they can be
+        # processed at once, then sort them by onset (start) time then pitch.
+        # lexsort is stable, so simultaneous notes keep the order of their tracks.
+        nb_notes = sum(len(track.notes) for track in tracks)
+        starts = np.empty(nb_notes, dtype=np.int64)
+        ends, pitches, velocities, programs = (np.empty_like(starts) for _ in range(4))
+        offset = 0
+        for track in tracks:
+            nb_track_notes = len(track.notes)
+            if nb_track_notes == 0:
+                continue
+            track_notes = slice(offset, offset + nb_track_notes)
+            starts[track_notes] = [note.start for note in track.notes]
+            ends[track_notes] = [note.end for note in track.notes]
+            pitches[track_notes] = [note.pitch for note in track.notes]
+            velocities[track_notes] = [note.velocity for note in track.notes]
+            programs[track_notes] = -1 if track.is_drum else track.program
+            offset += nb_track_notes
+        notes_order = np.lexsort((pitches, starts))
+        starts = starts[notes_order]
+        ends = ends[notes_order]
+        pitches = pitches[notes_order]
+        velocities = velocities[notes_order]
+        programs = programs[notes_order]
+
+        # Quantize all note durations at once to the index of their nearest bin
+        # (dur_bins is sorted, ties go to the shortest duration)
+        durations = ends - starts
+        dur_indexes = np.searchsorted(dur_bins, durations).clip(1, len(dur_bins) - 1)
+        dur_indexes -= (
+            durations - dur_bins[dur_indexes - 1] <= dur_bins[dur_indexes] - durations
+        )
+
         # Creates events
         events: List[Event] = []
-        previous_tick = -1
-        previous_note_end = (
-            notes_with_program[0][0].start + 1
-        )  # so that no rest is created before the first note
         # Bar
         if self.config.additional_params[
             "max_bar_embedding"
         ]:  # Check bar embedding limit, update if needed
             nb_bars = ceil(
-                max(n[0].end for n in notes_with_program)
-                / (self._current_midi_metadata["time_division"] * 4)
+                int(ends.max()) / (self._current_midi_metadata["time_division"] * 4)
             )
             if self.config.additional_params["max_bar_embedding"] < nb_bars:
                 for i in range(
@@ -99,22 +151,45 @@ class REMIPlus(MIDITokenizer):
                     self.add_to_vocab(f"Bar_{i}")
                 self.config.additional_params["max_bar_embedding"] = nb_bars
         current_bar = -1
+        # Local bindings of the attributes accessed for each note
+        use_time_signatures = self.config.use_time_signatures
+        use_tempos = self.config.use_tempos
+        bar_embedding = self.config.additional_params["max_bar_embedding"] is not None
+        bar_values = self._bar_values
+        tempo_changes = self._current_midi_metadata["tempo_changes"]
+        time_sig_changes = self._current_midi_metadata["time_sig_changes"]
+        nb_tempo_changes = len(tempo_changes)
+        nb_time_sig_changes = len(time_sig_changes)
+        reduce_time_signature = self._reduce_time_signature
+        durations_values = self._durations_values
         # Tempo
         current_tempo_idx = 0
-        current_tempo = self._current_midi_metadata["tempo_changes"][
-            current_tempo_idx
-        ].tempo
+        current_tempo = tempo_changes[current_tempo_idx].tempo
         # TimeSignature
         current_time_sig_idx = 0
         current_time_sig_tick = 0
         current_time_sig_bar = 0
-        time_sig_change = self._current_midi_metadata["time_sig_changes"][
-            current_time_sig_idx
-        ]
-        current_time_sig = self._reduce_time_signature(
+        time_sig_change = time_sig_changes[current_time_sig_idx]
+        current_time_sig = reduce_time_signature(
             time_sig_change.numerator, time_sig_change.denominator
         )
+        current_time_sig_value = f"{current_time_sig[0]}/{current_time_sig[1]}"
         ticks_per_bar = time_division * current_time_sig[0]
+        # Positions of the notes within their bars, from the time signature at their onsets
+        notes_ticks_per_bar = ticks_per_bar
+        if use_time_signatures:
+            time_sigs_ticks = np.array([ts.time for ts in time_sig_changes])
+            time_sigs_ticks_per_bar = np.array(
+                [
+                    time_division
+                    * reduce_time_signature(ts.numerator, ts.denominator)[0]
+                    for ts in time_sig_changes
+                ]
+            )
+            notes_ticks_per_bar = time_sigs_ticks_per_bar[
+                (np.searchsorted(time_sigs_ticks, starts, side="right") - 1).clip(0)
+            ]
+        positions = ((starts % notes_ticks_per_bar) / ticks_per_sample).astype(np.int64)
         # (Chord)
         if self.config.use_chords:  # "Chord" in additional tokens
             for track in tracks:  # find chords per track
@@ -137,145 +212,158 @@ class REMIPlus(MIDITokenizer):
                         Event("Program", track.program, chord.time, "ProgramChord")
                     )
                     events.append(chord)
-        events.sort(key=lambda x: x.time)
-
-        for note, (program_num, is_drum) in notes_with_program:
-            if note.start != previous_tick:
-                # Bar
-                nb_new_bars = note.start // ticks_per_bar - current_bar
-                for i in range(nb_new_bars):
+        # The chord events are not sorted here, the final sort being stable the chords
+        # of a same onset keep the order of their tracks
+
+        # Bar, TimeSig and Tempo events only depend on the onset times, they are
+        # created once per distinct onset, i.e. for the first note of each onset
+        onsets_idx = np.flatnonzero(np.diff(starts, prepend=-1))
+        for start, pos_index in zip(
+            starts[onsets_idx].tolist(), positions[onsets_idx].tolist()
+        ):
+            # Bar
+            nb_new_bars = start // ticks_per_bar - current_bar
+            if bar_embedding and current_bar + nb_new_bars >= len(bar_values):
+                bar_values.extend(
+                    map(str, range(len(bar_values), current_bar + nb_new_bars + 1))
+                )
+            for i in range(nb_new_bars):
+                events.append(
+                    Event(
+                        type="Bar",
+                        value=bar_values[current_bar + i + 1]
+                        if bar_embedding
+                        else "None",
+                        time=(current_bar + i + 1) * ticks_per_bar,
+                        desc=0,
+                    )
+                )
+            current_bar += nb_new_bars
+
+            # (TimeSignature)
+            if use_time_signatures:
+                # Advances over the time signature changes that happened before the current moment
+                # (both notes and changes are sorted by time, so the index never goes back)
+                while (
+                    current_time_sig_idx + 1 < nb_time_sig_changes
+                    and time_sig_changes[current_time_sig_idx + 1].time <= start
+                ):
+                    current_time_sig_idx += 1  # update time signature value (might not change) and index
+                    time_sig_change = time_sig_changes[current_time_sig_idx]
+                    current_time_sig = reduce_time_signature(
+                        time_sig_change.numerator,
+                        time_sig_change.denominator,
+                    )
+                    current_time_sig_value = (
+                        f"{current_time_sig[0]}/{current_time_sig[1]}"
+                    )
+                    current_time_sig_bar += (
+                        time_sig_change.time - current_time_sig_tick
+                    ) // ticks_per_bar
+                    current_time_sig_tick = time_sig_change.time
+                    ticks_per_bar = time_division * current_time_sig[0]
+                if nb_new_bars > 0:  # put a TimeSig token after the Bar token
                     events.append(
                         Event(
-                            type="Bar",
-                            value=str(current_bar + i + 1)
-                            if self.config.additional_params["max_bar_embedding"]
-                            is not None
-                            else "None",
-                            time=(current_bar + i + 1) * ticks_per_bar,
-                            desc=0,
+                            type="TimeSig",
+                            value=current_time_sig_value,
+                            time=start,
                         )
                     )
-                current_bar += nb_new_bars
-
-                # (TimeSignature)
-                if self.config.use_time_signatures:
-                    # If the current time signature is not the last one
-                    if current_time_sig_idx + 1 < len(
-                        self._current_midi_metadata["time_sig_changes"]
-                    ):
-                        # Will loop over incoming time signature changes
-                        for time_sig_change in self._current_midi_metadata[
-                            "time_sig_changes"
-                        ][current_time_sig_idx + 1 :]:
-                            # If this time signature change happened before the current moment
-                            if time_sig_change.time <= note.start:
-                                current_time_sig = self._reduce_time_signature(
-                                    time_sig_change.numerator,
-                                    time_sig_change.denominator,
-                                )
-                                current_time_sig_idx += 1  # update time signature value (might not change) and index
-                                current_time_sig_bar += (
-                                    time_sig_change.time - current_time_sig_tick
-                                ) // ticks_per_bar
-                                current_time_sig_tick = time_sig_change.time
-                                ticks_per_bar = time_division * current_time_sig[0]
-                            elif time_sig_change.time > note.start:
-                                break  # this time signature change is beyond the current time step, we break the loop
-                    if nb_new_bars > 0:  # put a TimeSig token after the Bar token
-                        events.append(
-                            Event(
-                                type="TimeSig",
-                                value=f"{current_time_sig[0]}/{current_time_sig[1]}",
-                                time=note.start,
-                            )
-                        )
 
-                # (Tempo)
-                if self.config.use_tempos:
-                    is_tempo_changed = False
-                    # If the current tempo is not the last one
-                    if current_tempo_idx + 1 < len(
-                        self._current_midi_metadata["tempo_changes"]
-                    ):
-                        # Will loop over incoming tempo changes
-                        for tempo_change in self._current_midi_metadata[
-                            "tempo_changes"
-                        ][current_tempo_idx + 1 :]:
-                            # If this tempo change happened before the current moment
-                            if tempo_change.time <= note.start:
-                                current_tempo = tempo_change.tempo
-                                current_tempo_idx += (
-                                    1  # update tempo value (might not change) and index
-                                )
-                                is_tempo_changed = True
-                            else:  # <==> elif tempo_change.time > previous_tick:
-                                break  # this tempo change is beyond the current time step, we break the loop
-                    if is_tempo_changed or nb_new_bars > 0:  # after the new Bar token
-                        # Position before the Tempo token
-                        pos_index = int((note.start % ticks_per_bar) / ticks_per_sample)
-                        events.append(
-                            Event(
-                                type="Position",
-                                value=pos_index,
-                                time=note.start,
-                                desc="PositionTempo",
-                            )
+            # (Tempo)
+            if use_tempos:
+                is_tempo_changed = False
+                # Advances over the tempo changes that happened before the current moment
+                while (
+                    current_tempo_idx + 1 < nb_tempo_changes
+                    and tempo_changes[current_tempo_idx + 1].time <= start
+                ):
+                    current_tempo_idx += (
+                        1  # update tempo value (might not change) and index
+                    )
+                    is_tempo_changed = True
+                current_tempo = tempo_changes[current_tempo_idx].tempo
+                if is_tempo_changed or nb_new_bars > 0:  # after the new Bar token
+                    # Position before the Tempo token
+                    events.append(
+                        Event(
+                            type="Position",
+                            value=pos_index,
+                            time=start,
+                            desc="PositionTempo",
                         )
-                        events.append(
-                            Event(
-                                type="Tempo",
-                                value=current_tempo,
-                                time=note.start,
-                                desc=note.start,
-                            )
+                    )
+                    events.append(
+                        Event(
+                            type="Tempo",
+                            value=current_tempo,
+                            time=start,
+                            desc=start,
                         )
+                    )
 
-                previous_tick = note.start
-
-            # Position
-            pos_index = int((note.start % ticks_per_bar) / ticks_per_sample)
-            events.append(
-                Event(
-                    type="Position",
-                    value=pos_index,
-                    time=note.start,
-                    desc="NotePosition",
-                )
+        # Events of the notes, five per note, are written in a preallocated list.
+        # It is concatenated to the events list before the final sort.
+        note_events: List[Event] = [None] * (5 * nb_notes)
+        ei = 0
+        for start, end, pitch, velocity, program, pos_index, dur_index in zip(
+            starts.tolist(),
+            ends.tolist(),
+            pitches.tolist(),
+            velocities.tolist(),
+            programs.tolist(),
+            positions.tolist(),
+            dur_indexes.tolist(),
+        ):
+            # Position / Program / Pitch / Velocity / Duration
+            note_events[ei] = Event(
+                type="Position",
+                value=pos_index,
+                time=start,
+                desc="NotePosition",
             )
-            # Pitch / Velocity / Duration
-            events.append(
-                Event(
-                    type="Program",
-                    value=-1 if is_drum else program_num,
-                    time=note.start,
-                    desc=note.pitch,
-                )
+            note_events[ei + 1] = Event(
+                type="Program",
+                value=program,
+                time=start,
+                desc=pitch,
             )
-            events.append(
-                Event(type="Pitch", value=note.pitch, time=note.start, desc=note.pitch)
+            note_events[ei + 2] = Event(
+                type="Pitch", value=pitch, time=start, desc=pitch
             )
-            events.append(
-                Event(
-                    type="Velocity",
-                    value=note.velocity,
-                    time=note.start,
-                    desc=f"{note.velocity}",
-                )
+            note_events[ei + 3] = Event(
+                type="Velocity",
+                value=velocity,
+                time=start,
+                desc=f"{velocity}",
             )
-            duration = note.end - note.start
-            index = np.argmin(np.abs(dur_bins - duration))
-            events.append(
-                Event(
-                    type="Duration",
-                    value=".".join(map(str, self.durations[index])),
-                    time=note.start,
-                    desc=f"{duration} ticks",
-                )
+            duration = end - start
+            note_events[ei + 4] = Event(
+                type="Duration",
+                value=durations_values[dur_index],
+                time=start,
+                desc=f"{duration} ticks",
             )
-            previous_note_end = max(previous_note_end, note.end)
+            ei += 5
 
-        events.sort(key=lambda x: (x.time, self._order(x)))
-        return events
+        # Sorts the events by time then order, with precomputed keys so that the order
+        # of each event is not evaluated by the sort. The events of notes, whose
+        # times are their onsets, all come with the default order (8).
+        times = np.concatenate(
+            [
+                np.fromiter((e.time for e in events), np.int64, len(events)),
+                starts.repeat(5),
+            ]
+        )
+        orders = np.concatenate(
+            [
+                np.fromiter((self._order(e) for e in events), np.int64, len(events)),
+                np.full(5 * nb_notes, 8),
+            ]
+        )
+        events += note_events
+        return [events[i] for i in np.lexsort((orders, times)).tolist()]
 
     @_out_as_complete_seq
     def track_to_tokens(self, track: Instrument) -> TokSequence:
@@ -319,7 +407,7 @@ class REMIPlus(MIDITokenizer):
         self.complete_sequence(tok_sequence)
         return tok_sequence
 
-    @_in_as_seq()
+    @_in_as_seq(complete=False)
     def tokens_to_midi(
         self,
         tokens: Union[TokSequence, List, np.ndarray, Any],
@@ -336,12 +424,15 @@ class REMIPlus(MIDITokenizer):
         :return: the midi object (:class:`miditoolkit.MidiFile`).
         """
         tokens = cast(TokSequence, tokens)
+        # Only the ids are decoded, the sequence is completed only if they are missing
+        if tokens.ids is None:
+            self.complete_sequence(tokens)
         midi = MidiFile(ticks_per_beat=time_division)
         assert (
-            time_division % max(self.config.beat_res.values()) == 0
-        ), f"Invalid time division, please give one divisible by {max(self.config.beat_res.values())}"
-        tokens = cast(List[str], tokens.tokens)  # for reducing type errors
-        ticks_per_sample = time_division // max(self.config.beat_res.values())
+            time_division % self._max_beat_res == 0
+        ), f"Invalid time division, please give one divisible by {self._max_beat_res}"
+        ids = cast(List[int], tokens.ids)  # for reducing type errors
+        ticks_per_sample = time_division // self._max_beat_res
 
         # RESULTS
         instruments: Dict[int, Instrument] = {}
@@ -356,72 +447,71 @@ class REMIPlus(MIDITokenizer):
         current_tick = 0
         current_bar = -1
         previous_note_end = 0
-        for ti, token in enumerate(tokens):
-            if token.split("_")[0] == "Bar":
+        # Types (as integer codes) and values of the tokens, read from their ids
+        ids_types, ids_values = self._token_ids_types_values()
+        types = ids_types[ids].tolist()
+        values = [ids_values[id_] for id_ in ids]
+        nb_tokens = len(types)
+        for ti, (tok_type, tok_val) in enumerate(zip(types, values)):
+            if tok_type == _BAR:
                 current_bar += 1
                 current_tick = current_bar * ticks_per_bar
-            elif token.split("_")[0] == "Rest":
-                beat, pos = map(int, tokens[ti].split("_")[1].split("."))
+            elif tok_type == _REST:
+                beat, pos = map(int, tok_val.split("."))
                 if (
                     current_tick < previous_note_end
                 ):  # if in case successive rest happen
                     current_tick = previous_note_end
                 current_tick += beat * time_division + pos * ticks_per_sample
                 current_bar = current_tick // ticks_per_bar
-            elif token.split("_")[0] == "Position":
+            elif tok_type == _POSITION:
                 if current_bar == -1:
                     current_bar = (
                         0  # as this Position token occurs before any Bar token
                     )
-                current_tick = (
-                    current_bar * ticks_per_bar
-                    + int(token.split("_")[1]) * ticks_per_sample
-                )
-            elif token.split("_")[0] == "Tempo":
+                current_tick = current_bar * ticks_per_bar + tok_val * ticks_per_sample
+            elif tok_type == _TEMPO:
                 # If your encoding include tempo tokens, each Position token should be followed by
                 # a tempo token, but if it is not the case this method will skip this step
-                tempo = int(token.split("_")[1])
+                tempo = tok_val
                 if tempo != tempo_changes[-1].tempo:
                     tempo_changes.append(TempoChange(tempo, current_tick))
-            elif token.split("_")[0] == "TimeSig":
-                num, den = self._parse_token_time_signature(token.split("_")[1])
+            elif tok_type == _TIME_SIG:
+                num, den = self._parse_token_time_signature(tok_val)
                 current_time_signature = time_signature_changes[-1]
                 if (
                     num != current_time_signature.numerator
                     and den != current_time_signature.denominator
                 ):
                     time_signature_changes.append(TimeSignature(num, den, current_tick))
-            elif token.split("_")[0] == "Pitch":
-                try:
-                    if (
-                        tokens[ti + 1].split("_")[0] == "Velocity"
-                        and tokens[ti + 2].split("_")[0] == "Duration"
-                        and tokens[ti - 1].split("_")[0] == "Program"
-                    ):
-                        program = int(tokens[ti - 1].split("_")[1])
-                        pitch = int(tokens[ti].split("_")[1])
-                        vel = int(tokens[ti + 1].split("_")[1])
-                        duration = self._token_duration_to_ticks(
-                            tokens[ti + 2].split("_")[1], time_division
-                        )
-                        if program not in instruments.keys():
-                            instruments[program] = Instrument(
-                                program=0 if program == -1 else program,
-                                is_drum=program == -1,
-                                name="Drums"
-                                if program == -1
-                                else MIDI_INSTRUMENTS[program]["name"],
-                            )
-                        instruments[program].notes.append(
-                            Note(vel, pitch, current_tick, current_tick + duration)
-                        )
-                        previous_note_end = max(
-                            previous_note_end, current_tick + duration
+            elif tok_type == _PITCH:
+                # The note tokens of generated or unfinished sequences might be
+                # incomplete, their successors (and predecessor) are checked first
+                if (
+                    0 < ti < nb_tokens - 2
+                    and types[ti + 1] == _VELOCITY
+                    and types[ti + 2] == _DURATION
+                    and types[ti - 1] == _PROGRAM
+                ):
+                    program = values[ti - 1]
+                    pitch = tok_val
+                    vel = values[ti + 1]
+                    duration = self._token_duration_to_ticks(
+                        values[ti + 2], time_division
+                    )
+                    instrument = instruments.get(program)
+                    if instrument is None:
+                        instrument = instruments[program] = Instrument(
+                            program=0 if program == -1 else program,
+                            is_drum=program == -1,
+                            name="Drums"
+                            if program == -1
+                            else MIDI_INSTRUMENTS[program]["name"],
                         )
-                except (
-                    IndexError
-                ):  # A well constituted sequence should not raise an exception
-                    pass  # However with generated sequences this can happen, or if the sequence isn't finished
+                    instrument.notes.append(
+                        Note(vel, pitch, current_tick, current_tick + duration)
+                    )
+                    previous_note_end = max(previous_note_end, current_tick + duration)
         if len(tempo_changes) > 1:
             del tempo_changes[0]  # delete mocked tempo change
         tempo_changes[0].time = 0
@@ -432,18 +522,43 @@ class REMIPlus(MIDITokenizer):
         midi.instruments = list(instruments.values())
         midi.tempo_changes = tempo_changes
         midi.time_signature_changes = time_signature_changes
-        midi.max_tick = max(
-            [
-                max([note.end for note in track.notes]) if len(track.notes) > 0 else 0
-                for track in midi.instruments
-            ]
-        )
+        midi.max_tick = previous_note_end  # end of the last note, tracked when decoding
         # Write MIDI file
         if output_path:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             midi.dump(output_path)
         return midi
 
+    def _token_ids_types_values(self) -> Tuple[np.ndarray, List[Union[int, str]]]:
+        r"""Returns two tables indexed by the ids of the base vocabulary: the codes of
+        the types of the tokens (-1 for types that are not decoded), and their values,
+        as integers or as strings for values that are parsed when decoding (durations,
+        time signatures...). They allow :py:meth:`miditok.REMIPlus.tokens_to_midi` to
+        decode tokens without parsing their strings. As the vocabulary can change after
+        the creation of the tokenizer (new *Bar* tokens, BPE), the tables are rebuilt
+        whenever it is modified.
+
+        :return: the type codes and values of the token ids.
+        """
+        if (
+            self._decoding_tables is not None
+            and self._decoding_tables[0] is self._vocab_base
+            and self._decoding_tables[1] == len(self._vocab_base)
+        ):
+            return self._decoding_tables[2], self._decoding_tables[3]
+
+        nb_ids = max(self._vocab_base.values()) + 1
+        types = np.full(nb_ids, -1, dtype=np.intc)
+        values: List[Union[int, str]] = [None] * nb_ids
+        for token, id_ in self._vocab_base.items():
+            tok_type, tok_val = token.split("_", 1)
+            types[id_] = _TOKEN_TYPES_CODES.get(tok_type, -1)
+            values[id_] = (
+                int(tok_val) if tok_type in _INT_VALUE_TOKEN_TYPES else tok_val
+            )
+        self._decoding_tables = (self._vocab_base, len(self._vocab_base), types, values)
+        return types, values
+
     def _create_base_vocabulary(
         self, sos_eos_tokens: Optional[bool] = None
     ) -> List[str]:
@@ -457,48 +572,63 @@ class REMIPlus(MIDITokenizer):
 
         :return: the vocabulary as a list of string.
         """
-        vocab = []
-
-        # BAR
-        if self.config.additional_params["max_bar_embedding"] is not None:
-            vocab += [
-                f"Bar_{i}"
-                for i in range(self.config.additional_params["max_bar_embedding"])
-            ]
-        else:
-            vocab += ["Bar_None"]
-
-        # PITCH
-        vocab += [f"Pitch_{i}" for i in range(*self.config.pitch_range)]
-
-        # VELOCITY
-        vocab += [f"Velocity_{i}" for i in self.velocities]
-
-        # DURATION
-        vocab += [
-            f'Duration_{".".join(map(str, duration))}' for duration in self.durations
-        ]
-
-        # POSITION
-        nb_positions = max(self.config.beat_res.values()) * 4  # 4/4 time signature
-        vocab += [f"Position_{i}" for i in range(nb_positions)]
-
-        # TIME SIGNATURE
-        if self.config.use_time_signatures:
-            vocab += [f"TimeSig_{i[0]}/{i[1]}" for i in self.time_signatures]
-
-        # CHORD
-        if self.config.use_chords:
-            vocab += self._create_chords_tokens()
-
-        # TEMPO
-        if self.config.use_tempos:
-            vocab += [f"Tempo_{i}" for i in self.tempos]
-
-        # PROGRAM
-        vocab += [f"Program_{program}" for program in self.config.programs]
-
-        return vocab
+        max_bar_embedding = self.config.additional_params["max_bar_embedding"]
+        nb_positions = self._max_beat_res * 4  # 4/4 time signature
+
+        # Tokenizers created with the same parameters share the same vocabulary, it is
+        # created once and copied as the caller might modify it
+        cache_key = (
+            max_bar_embedding,
+            tuple(self.config.pitch_range),
+            tuple(self.velocities.tolist()),
+            tuple(self.durations),
+            nb_positions,
+            tuple(self.time_signatures) if self.config.use_time_signatures else None,
+            (
+                self.config.chord_tokens_with_root_note,
+                tuple(self.config.chord_maps),
+                self.config.chord_unknown and tuple(self.config.chord_unknown),
+            )
+            if self.config.use_chords
+            else None,
+            tuple(self.tempos.tolist()) if self.config.use_tempos else None,
+            tuple(self.config.programs),
+        )
+        if cache_key in self._base_vocabularies_cache:
+            return list(self._base_vocabularies_cache[cache_key])
+
+        # The tokens of each type are chained and gathered into the vocabulary at once
+        vocab = list(
+            chain(
+                # BAR
+                (f"Bar_{i}" for i in range(max_bar_embedding))
+                if max_bar_embedding is not None
+                else ("Bar_None",),
+                # PITCH
+                (f"Pitch_{i}" for i in range(*self.config.pitch_range)),
+                # VELOCITY
+                (f"Velocity_{i}" for i in self.velocities),
+                # DURATION
+                (
+                    f'Duration_{".".join(map(str, duration))}'
+                    for duration in self.durations
+                ),
+                # POSITION
+                (f"Position_{i}" for i in range(nb_positions)),
+                # TIME SIGNATURE
+                (f"TimeSig_{i[0]}/{i[1]}" for i in self.time_signatures)
+                if self.config.use_time_signatures
+                else (),
+                # CHORD
+                self._create_chords_tokens() if self.config.use_chords else (),
+                # TEMPO
+                (f"Tempo_{i}" for i in self.tempos) if self.config.use_tempos else (),
+                # PROGRAM
+                (f"Program_{program}" for program in self.config.programs),
+            )
+        )
+        self._base_vocabularies_cache[cache_key] = vocab
+        return list(vocab)
 
     def _create_token_types_graph(self) -> Dict[str, List[str]]:
         r"""Returns a graph (as a dictionary) of the possible token
@@ -506,6 +636,20 @@ class REMIPlus(MIDITokenizer):
 
         :return: the token types transitions dictionary
         """
+        cache_key = (
+            self.config.use_time_signatures,
+            self.config.use_chords,
+            self.config.use_tempos,
+        )
+        if cache_key in self._token_types_graphs_cache:
+            # Copies the successors lists, special tokens are added to them in place
+            return {
+                token_type: list(next_types)
+                for token_type, next_types in self._token_types_graphs_cache[
+                    cache_key
+                ].items()
+            }
+
         dic: Dict[str, List[str]] = dict()
 
         dic["Bar"] = ["Position", "Bar"]
@@ -527,6 +671,9 @@ class REMIPlus(MIDITokenizer):
             dic["Tempo"] = ["Position"]
             dic["Position"] += ["Tempo"]
 
+        self._token_types_graphs_cache[cache_key] = {
+            token_type: list(next_types) for token_type, next_types in dic.items()
+        }
         return dic
 
     @staticmethod
@@ -536,18 +683,10 @@ class REMIPlus(MIDITokenizer):
         :param x: event to get order index
         :return: an order int
         """
-        if x.type == "Bar":
-            return 0
-        elif x.type == "TimeSig":
-            return 1
-        elif x.type == "Position" and x.desc == "PositionTempo":
-            return 2
-        elif x.type == "Tempo":
-            return 3
-        elif x.type == "Rest":
-            return 7
-        else:  # for other types of events, the order should be handle when inserting the events in the sequence
-            return 8
+        if x.type == "Position":
+            return REMIPlus._POSITION_ORDER.get(x.desc, 8)
+        # for other types of events, the order should be handle when inserting the events in the sequence
+        return REMIPlus._ORDER_TABLE.get(x.type, 8)
 
     @_in_as_seq(complete=False, decode_bpe=False)
     def tokens_errors(
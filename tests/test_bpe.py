@@ -6,7 +6,7 @@
 from copy import deepcopy
 from pathlib import Path, PurePath
 from typing import Union
-from time import time
+from time import perf_counter_ns
 import random
 
 import miditok
@@ -42,7 +42,7 @@ def test_bpe_conversion(
     random.seed(777)
     tokenizations = ["Structured", "REMI", "REMIPlus", "MIDILike", "TSD", "MMM"]
     data_path = Path(data_path)
-    files = list(data_path.glob("**/*.mid"))
+    files = sorted(data_path.rglob("*.mid"))
 
     # Creates tokenizers and computes BPE (build voc)
     first_tokenizers = []
@@ -104,36 +104,47 @@ def test_bpe_conversion(
             tokenizers[i] == first_tokenizers[i]
         ), "Saving and reloading tokenizer failed. The reloaded tokenizer is different from the first one."
 
+    # Reads the MIDIs once, they are copied before being tokenized as tokenizers
+    # modify (preprocess) them inplace
+    midis = [MidiFile(file_path) for file_path in tqdm(files, desc="Reading MIDIs")]
+
     # Unbatched BPE
     at_least_one_error = False
     tok_times = []
-    for i, file_path in enumerate(tqdm(files, desc="Testing BPE unbatched")):
-        midi = MidiFile(file_path)
-
-        for tokenization, tokenizer in zip(tokenizations, tokenizers):
+    for tokenization, tokenizer in zip(tokenizations, tokenizers):
+        for i, (file_path, midi) in enumerate(
+            tqdm(
+                zip(files, midis),
+                desc=f"Testing BPE unbatched {tokenization}",
+                total=len(files),
+            )
+        ):
             tokens_no_bpe = tokenizer(deepcopy(midi), apply_bpe_if_possible=False)
             if not tokenizer.one_token_stream:
                 tokens_no_bpe = tokens_no_bpe[0]
             tokens_bpe = deepcopy(tokens_no_bpe)  # with BPE
 
-            t0 = time()
+            t0 = perf_counter_ns()
             tokenizer.apply_bpe(tokens_bpe)
-            tok_times.append(time() - t0)
+            tok_times.append(perf_counter_ns() - t0)
 
             tokens_bpe_decoded = deepcopy(tokens_bpe)
             tokenizer.decode_bpe(tokens_bpe_decoded)  # BPE decomposed
             if tokens_bpe != first_samples_bpe[tokenization][i]:
                 at_least_one_error = True
-                print(
+                tqdm.write(
                     f"Error with BPE for {tokenization} and {file_path.name}: "
                     f"BPE encoding failed after tokenizer reload"
                 )
             if tokens_no_bpe != tokens_bpe_decoded:
                 at_least_one_error = True
-                print(
+                tqdm.write(
                     f"Error with BPE for {tokenization} and {file_path.name}: encoding - decoding test failed"
                 )
-    print(f"Mean BPE encoding time unbatched: {sum(tok_times) / len(tok_times):.2f}")
+    print(
+        f"Mean BPE encoding time unbatched: "
+        f"{sum(tok_times) / len(tok_times) * 1e-9:.2f}"
+    )
     assert not at_least_one_error
 
     # Batched BPE
@@ -141,18 +152,16 @@ def test_bpe_conversion(
     tok_times = []
     for tokenization, tokenizer in zip(tokenizations, tokenizers):
         samples_no_bpe = []
-        for i, file_path in enumerate(tqdm(files, desc="Testing BPE batched")):
-            # Reads the midi
-            midi = MidiFile(file_path)
+        for midi in tqdm(midis, desc="Testing BPE batched"):
+            tokens_no_bpe = tokenizer(deepcopy(midi), apply_bpe_if_possible=False)
             if not tokenizer.one_token_stream:
-                samples_no_bpe.append(tokenizer(midi, apply_bpe_if_possible=False)[0])
-            else:
-                samples_no_bpe.append(tokenizer(midi, apply_bpe_if_possible=False))
+                tokens_no_bpe = tokens_no_bpe[0]
+            samples_no_bpe.append(tokens_no_bpe)
 
-        t0 = time()
+        t0 = perf_counter_ns()
         samples_bpe = deepcopy(samples_no_bpe)
         tokenizer.apply_bpe(samples_bpe)
-        tok_times.append((time() - t0) / len(files))
+        tok_times.append((perf_counter_ns() - t0) / len(files))
 
         samples_bpe_decoded = deepcopy(samples_bpe)
         tokenizer.decode_bpe(samples_bpe_decoded)  # BPE decomposed
@@ -172,7 +181,9 @@ def test_bpe_conversion(
                 print(
                     f"Error with BPE for {tokenization}: encoding - decoding test failed"
                 )
-    print(f"Mean BPE encoding time batched: {sum(tok_times) / len(tok_times):.2f}")
+    print(
+        f"Mean BPE encoding time batched: {sum(tok_times) / len(tok_times) * 1e-9:.2f}"
+    )
     assert not at_least_one_error
 
 
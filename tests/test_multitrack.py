@@ -73,11 +73,12 @@ def test_multitrack_midi_to_tokens_to_midi(
         "MuMIDI",
         "MMM",
     ]
-    files = list(Path(data_path).glob("**/*.mid"))
+    files = sorted(Path(data_path).rglob("*.mid"))
     at_least_one_error = False
 
-    for i, file_path in enumerate(tqdm(files, desc="Testing multitrack")):
-        # Reads the MIDI
+    # Reads the MIDIs once, they are then tokenized with each tokenization in turn
+    midis = []
+    for i, file_path in enumerate(files):
         try:
             midi = MidiFile(Path(file_path))
         except (
@@ -86,13 +87,18 @@ def test_multitrack_midi_to_tokens_to_midi(
             continue
         if midi.ticks_per_beat % max(BEAT_RES_TEST.values()) != 0:
             continue
-        has_errors = False
+        midis.append((i, file_path, midi))
 
-        for tokenization in tokenizations:
-            tokenizer_config = miditok.TokenizerConfig(**TOKENIZER_PARAMS)
-            tokenizer: miditok.MIDITokenizer = getattr(miditok, tokenization)(
-                tokenizer_config=tokenizer_config
-            )
+    for tokenization in tokenizations:
+        tokenizer_config = miditok.TokenizerConfig(**TOKENIZER_PARAMS)
+        tokenizer: miditok.MIDITokenizer = getattr(miditok, tokenization)(
+            tokenizer_config=tokenizer_config
+        )
+
+        for i, file_path, midi in tqdm(
+            midis, desc=f"Testing multitrack {tokenization}"
+        ):
+            has_errors = False
 
             # Process the MIDI
             midi_to_compare = deepcopy(
@@ -137,7 +143,7 @@ def test_multitrack_midi_to_tokens_to_midi(
                 tokens[0] if not tokenizer.one_token_stream else tokens
             )
             if tokens_types != 0.0:
-                print(
+                tqdm.write(
                     f"Validation of tokens types / values successions failed with {tokenization}: {tokens_types:.2f}"
                 )
 
@@ -150,7 +156,7 @@ def test_multitrack_midi_to_tokens_to_midi(
                         for err, note, exp in track_err[-1]:
                             new_midi.markers.append(Marker(f'ERR {tokenization} with note {err} (pitch {note.pitch})',
                                                            note.start))"""
-                print(
+                tqdm.write(
                     f"MIDI {i} - {file_path} failed to encode/decode NOTES with "
                     f"{tokenization} ({sum(len(t[2]) for t in errors)} errors)"
                 )
@@ -165,7 +171,7 @@ def test_multitrack_midi_to_tokens_to_midi(
                 )
                 if len(tempo_errors) > 0:
                     has_errors = True
-                    print(
+                    tqdm.write(
                         f"MIDI {i} - {file_path} failed to encode/decode TEMPO changes with "
                         f"{tokenization} ({len(tempo_errors)} errors)"
                     )
@@ -181,7 +187,7 @@ def test_multitrack_midi_to_tokens_to_midi(
                 )
                 if len(time_sig_errors) > 0:
                     has_errors = True
-                    print(
+                    tqdm.write(
                         f"MIDI {i} - {file_path} failed to encode/decode TIME SIGNATURE changes with "
                         f"{tokenization} ({len(time_sig_errors)} errors)"
                     )
@@ -10,17 +10,22 @@ NOTE: encoded tracks has to be compared with the quantized original track.
 
 """
 
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+import os
 from pathlib import Path, PurePath
-from typing import Union
+from typing import Optional, Tuple, Union
 
 import miditok
 from miditoolkit import MidiFile, Marker
 from tqdm import tqdm
+from tqdm.contrib.concurrent import process_map
 
 from .tests_utils import (
     ALL_TOKENIZATIONS,
     track_equals,
+    notes_to_ndarray,
     tempo_changes_equals,
     time_signature_changes_equals,
     adapt_tempo_changes_times,
@@ -46,6 +51,140 @@ TOKENIZER_PARAMS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _create_tokenizers() -> Tuple[Tuple[str, miditok.MIDITokenizer, bool, bool], ...]:
+    r"""Creates the tokenizers of all the tokenizations, once per (worker) process,
+    they are then reused to test all the MIDIs.
+
+    :return: the tokenizations names, associated tokenizers, and whether their decoded
+            tempos and time signatures are to be checked
+    """
+    tokenizers = []
+    for tokenization in ALL_TOKENIZATIONS:
+        tokenizer_config = miditok.TokenizerConfig(**TOKENIZER_PARAMS)
+        # Increase the number of rest just to cover very long pauses / rests in test examples
+        if tokenization in ["MIDILike", "TSD"]:
+            tokenizer_config.rest_range = (
+                tokenizer_config.rest_range[0],
+                max(t[1] for t in BEAT_RES_TEST),
+            )
+        tokenizer: miditok.MIDITokenizer = getattr(miditok, tokenization)(
+            tokenizer_config=tokenizer_config
+        )
+
+        # printing the tokenizer shouldn't fail
+        _ = str(tokenizer)
+        tokenizers.append(
+            (
+                tokenization,
+                tokenizer,
+                tokenizer.config.use_tempos,
+                tokenization == "Octuple" and tokenizer.config.use_time_signatures,
+            )
+        )
+    return tuple(tokenizers)
+
+
+def _test_one_track_midi(file_path: Path) -> Tuple[bool, Optional[MidiFile]]:
+    r"""Reads a MIDI file, convert it into token sequences with all the tokenizations,
+    and convert them back to MIDIs, to compare them with the original one.
+    This method is run in worker processes, one MIDI at a time.
+
+    :param file_path: path of the MIDI file to test
+    :return: whether some errors were found, and if so the MIDI with the tracks converted
+            back and the erroneous notes marked, to be saved for debug
+    """
+    # Reads the midi, its content is kept in memory to parse it again if needed
+    midi_bytes = file_path.read_bytes()
+    midi = MidiFile(file=BytesIO(midi_bytes))
+    adapt_tempo_changes_times(midi.instruments, midi.tempo_changes)
+    # The track, tempo and time signature changes are quantized in place by the tokenizers
+    track_to_compare = midi.instruments[0]
+    tempo_changes_to_compare = midi.tempo_changes
+    time_sig_changes_to_compare = midi.time_signature_changes
+    time_division = midi.ticks_per_beat
+    tracks = []  # tracks converted back
+    notes = None  # the (quantized) notes of the MIDI, to compare with those decoded
+    has_errors = False
+
+    tokenizers = _create_tokenizers()
+    for tokenization, tokenizer, check_tempos, check_time_sigs in tokenizers:
+        # Convert the track in tokens
+        tokens = tokenizer(midi)
+
+        # Checks types and values conformity following the rules
+        tokens_types = tokenizer.tokens_errors(
+            tokens if tokenizer.one_token_stream else tokens[0]
+        )
+        if tokens_types != 0.0:
+            has_errors = True
+            tqdm.write(
+                f"Validation of tokens types / values successions failed with {tokenization}: {tokens_types:.2f}"
+            )
+            continue  # the tokens are not well formed, no need to decode them
+
+        # Convert back tokens into a track object
+        new_midi = tokenizer.tokens_to_midi(tokens, time_division=time_division)
+        track = new_midi.instruments[0]
+        tempo_changes = new_midi.tempo_changes
+        time_sig_changes = new_midi.time_signature_changes
+
+        # Checks its good
+        if notes is None:  # the MIDI is quantized by the first tokenizer
+            notes = notes_to_ndarray(track_to_compare.notes)
+        errors = track_equals(track_to_compare, track, notes)
+        if len(errors) > 0:
+            has_errors = True
+            if errors[0][0] != "len":
+                midi.markers.extend(
+                    [
+                        Marker(
+                            f"ERR {tokenization} with note {err} (pitch {note.pitch})",
+                            note.start,
+                        )
+                        for err, note, _ in errors
+                    ]
+                )
+            tqdm.write(
+                f"MIDI {file_path} failed to encode/decode NOTES with {tokenization} ({len(errors)} errors)"
+            )
+            # return False
+        track.name = f"encoded with {tokenization}"
+        tracks.append(track)
+
+        # Checks tempos
+        if check_tempos and tempo_changes is not None:
+            tempo_errors = tempo_changes_equals(tempo_changes_to_compare, tempo_changes)
+            if len(tempo_errors) > 0:
+                has_errors = True
+                tqdm.write(
+                    f"MIDI {file_path} failed to encode/decode TEMPO changes with "
+                    f"{tokenization} ({len(tempo_errors)} errors)"
+                )
+
+        # Checks time signatures
+        if check_time_sigs and time_sig_changes is not None:
+            time_sig_errors = time_signature_changes_equals(
+                time_sig_changes_to_compare, time_sig_changes
+            )
+            if len(time_sig_errors) > 0:
+                has_errors = True
+                tqdm.write(
+                    f"MIDI {file_path} failed to encode/decode TIME SIGNATURE changes with "
+                    f"{tokenization} ({len(time_sig_errors)} errors)"
+                )
+
+    if not has_errors:
+        return False, None
+    # The original track is only copied here, only if needed, by parsing the file again
+    # as the notes of midi have been quantized when tokenizing it
+    original_track = MidiFile(file=BytesIO(midi_bytes)).instruments[0]
+    track_to_compare.name = "original quantized"
+    original_track.name = "original not quantized"
+    midi.instruments += [original_track] + tracks
+    return True, midi
+
+
 def test_one_track_midi_to_tokens_to_midi(
     data_path: Union[str, Path, PurePath] = "./tests/Maestro_MIDIs",
     saving_erroneous_midis: bool = True,
@@ -53,109 +192,35 @@ def test_one_track_midi_to_tokens_to_midi(
     r"""Reads a few MIDI files, convert them into token sequences, convert them back to MIDI files.
     The converted back MIDI files should identical to original one, expect with note starting and ending
     times quantized, and maybe a some duplicated notes removed
+    The MIDI files are tested in parallel, by as many processes as there are CPUs.
 
     :param data_path: root path to the data to test
     :param saving_erroneous_midis: will save MIDIs converted back with errors, to be used to debug
     """
-    files = list(Path(data_path).glob("**/*.mid"))
+    files = sorted(Path(data_path).rglob("*.mid"))
     at_least_one_error = False
 
-    for i, file_path in enumerate(tqdm(files, desc="Testing One Track")):
-        # Reads the midi
-        midi = MidiFile(file_path)
-        adapt_tempo_changes_times(midi.instruments, midi.tempo_changes)
-        tracks = [deepcopy(midi.instruments[0])]
-        has_errors = False
-
-        for tokenization in ALL_TOKENIZATIONS:
-            tokenizer_config = miditok.TokenizerConfig(**TOKENIZER_PARAMS)
-            # Increase the number of rest just to cover very long pauses / rests in test examples
-            if tokenization in ["MIDILike", "TSD"]:
-                tokenizer_config.rest_range = (
-                    tokenizer_config.rest_range[0],
-                    max(t[1] for t in BEAT_RES_TEST),
-                )
-            tokenizer: miditok.MIDITokenizer = getattr(miditok, tokenization)(
-                tokenizer_config=tokenizer_config
-            )
-
-            # printing the tokenizer shouldn't fail
-            _ = str(tokenizer)
-
-            # Convert the track in tokens
-            tokens = tokenizer(midi)
-            if not tokenizer.one_token_stream:
-                tokens = tokens[0]
-
-            # Checks types and values conformity following the rules
-            tokens_types = tokenizer.tokens_errors(tokens)
-            if tokens_types != 0.0:
-                print(
-                    f"Validation of tokens types / values successions failed with {tokenization}: {tokens_types:.2f}"
-                )
-
-            # Convert back tokens into a track object
-            if not tokenizer.one_token_stream:
-                tokens = [tokens]
-            new_midi = tokenizer.tokens_to_midi(
-                tokens, time_division=midi.ticks_per_beat
-            )
-            track = new_midi.instruments[0]
-            tempo_changes = new_midi.tempo_changes
-            time_sig_changes = None
-            if tokenization == "Octuple":
-                time_sig_changes = new_midi.time_signature_changes
-
-            # Checks its good
-            errors = track_equals(midi.instruments[0], track)
-            if len(errors) > 0:
-                has_errors = True
-                if errors[0][0] != "len":
-                    for err, note, exp in errors:
-                        midi.markers.append(
-                            Marker(
-                                f"ERR {tokenization} with note {err} (pitch {note.pitch})",
-                                note.start,
-                            )
+    results = process_map(
+        _test_one_track_midi,
+        files,
+        max_workers=os.cpu_count(),
+        desc="Testing One Track",
+    )
+    # The erroneous MIDIs are written by background threads
+    with ThreadPoolExecutor(max_workers=2) as io_executor:
+        dumps = []
+        for file_path, (has_errors, midi) in zip(files, results):
+            if has_errors:
+                at_least_one_error = True
+                if saving_erroneous_midis:
+                    # Updates the MIDI and save it
+                    dumps.append(
+                        io_executor.submit(
+                            midi.dump, PurePath("tests", "test_results", file_path.name)
                         )
-                print(
-                    f"MIDI {i} - {file_path} failed to encode/decode NOTES with {tokenization} ({len(errors)} errors)"
-                )
-                # return False
-            track.name = f"encoded with {tokenization}"
-            tracks.append(track)
-
-            # Checks tempos
-            if tempo_changes is not None and tokenizer.config.use_tempos:
-                tempo_errors = tempo_changes_equals(midi.tempo_changes, tempo_changes)
-                if len(tempo_errors) > 0:
-                    has_errors = True
-                    print(
-                        f"MIDI {i} - {file_path} failed to encode/decode TEMPO changes with "
-                        f"{tokenization} ({len(tempo_errors)} errors)"
                     )
-
-            # Checks time signatures
-            if time_sig_changes is not None and tokenizer.config.use_time_signatures:
-                time_sig_errors = time_signature_changes_equals(
-                    midi.time_signature_changes, time_sig_changes
-                )
-                if len(time_sig_errors) > 0:
-                    has_errors = True
-                    print(
-                        f"MIDI {i} - {file_path} failed to encode/decode TIME SIGNATURE changes with "
-                        f"{tokenization} ({len(time_sig_errors)} errors)"
-                    )
-
-        if has_errors:
-            at_least_one_error = True
-            if saving_erroneous_midis:
-                midi.instruments[0].name = "original quantized"
-                tracks[0].name = "original not quantized"
-
-                # Updates the MIDI and save it
-                midi.instruments += tracks
-                midi.dump(PurePath("tests", "test_results", file_path.name))
+    for dump in dumps:
+        dump.result()  # raises the exception of the dump, if any
 
     assert not at_least_one_error
 
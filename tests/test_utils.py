@@ -38,7 +38,7 @@ def test_merge_tracks():
 
 
 def test_merge_same_program_tracks_and_by_class():
-    multitrack_midi_paths = list(Path("tests", "Multitrack_MIDIs").glob("**/*.mid"))
+    multitrack_midi_paths = sorted(Path("tests", "Multitrack_MIDIs").rglob("*.mid"))
     for midi_path in multitrack_midi_paths:
         midi = MidiFile(midi_path)
         for track in midi.instruments:
@@ -4,6 +4,7 @@
 
 from typing import Tuple, List, Union
 
+import numpy as np
 from miditoolkit import MidiFile, Instrument, Note, TempoChange, TimeSignature
 
 
@@ -19,6 +20,8 @@ ALL_TOKENIZATIONS = [
     "MuMIDI",
     "MMM",
 ]
+# Attributes of the notes compared by track_equals, in this order
+NOTES_ATTRIBUTES = ("start", "end", "pitch", "velocity")
 
 
 def midis_equals(
@@ -33,28 +36,42 @@ def midis_equals(
 
 
 def track_equals(
-    track1: Instrument, track2: Instrument
+    track1: Instrument, track2: Instrument, track1_notes: np.ndarray = None
 ) -> List[Tuple[str, Union[Note, int], int]]:
+    r"""Compares the notes of two tracks.
+
+    :param track1: expected track.
+    :param track2: track to compare to track1.
+    :param track1_notes: the notes of track1 as returned by :py:func:`notes_to_ndarray`,
+            to reuse them if they were already computed. (default: None)
+    :return: the errors, as tuples of the (first) wrong attribute, the note of track2 and
+            the expected value. If the tracks do not have the same number of notes, a
+            single "len" error.
+    """
     if len(track1.notes) != len(track2.notes):
         return [("len", len(track2.notes), len(track1.notes))]
+    if track1_notes is None:
+        track1_notes = notes_to_ndarray(track1.notes)
+    # Compares all the notes at once, the errors are built only for the wrong notes
+    diff = track1_notes != notes_to_ndarray(track2.notes)
     errors = []
-    for note1, note2 in zip(track1.notes, track2.notes):
-        err = notes_equals(note1, note2)
-        if err != "":
-            errors.append((err, note2, getattr(note1, err)))
+    for idx in np.flatnonzero(diff.any(axis=1)).tolist():
+        err = NOTES_ATTRIBUTES[int(diff[idx].argmax())]
+        errors.append((err, track2.notes[idx], getattr(track1.notes[idx], err)))
     return errors
 
 
-def notes_equals(note1: Note, note2: Note) -> str:
-    if note1.start != note2.start:
-        return "start"
-    elif note1.end != note2.end:
-        return "end"
-    elif note1.pitch != note2.pitch:
-        return "pitch"
-    elif note1.velocity != note2.velocity:
-        return "velocity"
-    return ""
+def notes_to_ndarray(notes: List[Note]) -> np.ndarray:
+    r"""Gathers the attributes of notes in an array of shape (N,4), where the
+    columns are the start, end, pitch and velocity values (:py:data:`NOTES_ATTRIBUTES`).
+
+    :param notes: notes to convert.
+    :return: the array of the notes attributes.
+    """
+    return np.array(
+        [(note.start, note.end, note.pitch, note.velocity) for note in notes],
+        dtype=np.int32,
+    ).reshape(-1, 4)
 
 
 def tempo_changes_equals(